@@ -1,20 +1,98 @@
 from __future__ import annotations
 
 import argparse
-import json
+import gzip
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict
 
 from .db import connect
 from .compute import compute_stats
-from .site import copy_static_site
+from . import jsonio
+from .site import copy_static_site, is_up_to_date, load_manifest, record_output, save_manifest
 
 def build_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser(prog="export_stats", description="Export static stats site (GitHub Pages friendly).")
     ap.add_argument("--db", required=True, help="Path to commander_tracker.sqlite")
     ap.add_argument("--docs", default="docs", help="Output docs directory (default: docs)")
     ap.add_argument("--site", default=None, help="Path to frontend/site (default: <repo>/frontend/site)")
+    ap.add_argument("--pretty", action="store_true", help="Indent stats.v1.json (for debugging; default is compact)")
+    ap.add_argument("--link", action="store_true", help="Hard link frontend files into docs instead of copying them")
+    ap.add_argument("--force", action="store_true", help="Rewrite every output, ignoring the incremental manifest")
     return ap
 
+def _source_signature(db_path: Path, pretty: bool) -> Dict[str, Any]:
+    """Inputs of stats.v1.json: size/mtime of the database (and its WAL, if
+    any), the aggregation code and the output layout."""
+    files = {}
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        if path.exists():
+            st = path.stat()
+            files[path.name] = [st.st_size, st.st_mtime_ns]
+    compute_src = Path(__file__).with_name("compute.py")
+    return {
+        "files": files,
+        "compute": hashlib.sha256(compute_src.read_bytes()).hexdigest(),
+        "pretty": pretty,
+    }
+
+def _payload_digest(payload: bytes, generated_utc: str) -> str:
+    """sha256 of the encoded stats with the generated_utc value left out, so
+    a re-export that would only move the timestamp hashes the same."""
+    h = hashlib.sha256()
+    view = memoryview(payload)
+    # "generated_utc" directly follows "version", so the first match is the
+    # field itself; slices of the memoryview are hashed without copying
+    stamp = jsonio.dumps(generated_utc)
+    i = payload.find(stamp)
+    if i < 0:
+        h.update(view)
+    else:
+        h.update(view[:i])
+        h.update(view[i + len(stamp):])
+    return h.hexdigest()
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Write a sibling temporary file and move it into place, so an
+    # interrupted export never leaves a truncated file behind
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def _export_stats(db_path: Path, docs_dir: Path, manifest: Dict[str, Any], pretty: bool) -> None:
+    """Compute the stats and write stats.v1.json (+ .gz) into docs_dir/data."""
+    data_dir = docs_dir / "data"
+
+    conn = connect(str(db_path))
+    try:
+        stats = compute_stats(conn)
+    finally:
+        conn.close()
+
+    # Encoded once: the same bytes are hashed, written and gzipped.
+    # Compact unless --pretty: the file is only read by fetch() in stats.js
+    payload = jsonio.dumps(stats, indent=pretty)
+    digest = _payload_digest(payload, stats["generated_utc"])
+    fresh_json = is_up_to_date(str(docs_dir), "data/stats.v1.json", digest, manifest)
+    fresh_gz = is_up_to_date(str(docs_dir), "data/stats.v1.json.gz", digest, manifest)
+    if not fresh_json:
+        _write_atomic(data_dir / "stats.v1.json", payload)
+        record_output(manifest, "data/stats.v1.json", digest)
+    if not (fresh_json and fresh_gz):
+        # Pre-compressed copy for stats.js (mtime=0 keeps the output reproducible).
+        # If the JSON was kept, compress the file on disk so both carry the
+        # same generated_utc.
+        raw = payload if not fresh_json else (data_dir / "stats.v1.json").read_bytes()
+        _write_atomic(data_dir / "stats.v1.json.gz", gzip.compress(raw, compresslevel=9, mtime=0))
+        record_output(manifest, "data/stats.v1.json.gz", digest)
+
 def main(argv: list[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
 
@@ -22,27 +100,42 @@ def main(argv: list[str] | None = None) -> int:
     site_dir = Path(args.site) if args.site else (repo_root / "frontend" / "site")
     docs_dir = Path(args.docs).resolve()
 
-    # (Re)create static site root
-    copy_static_site(str(site_dir), str(docs_dir))
+    manifest = load_manifest(str(docs_dir))
+    if args.force:
+        manifest.pop("data", None)
+        manifest.pop("source", None)
 
-    # Export JSON data
     data_dir = docs_dir / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    conn = connect(str(Path(args.db).resolve()))
-    try:
-        stats = compute_stats(conn)
-    finally:
-        conn.close()
+    # Sync static site root (only changed files are copied) in the background:
+    # it is I/O bound and only touches manifest["files"], while the stats
+    # export below only touches manifest["data"] and manifest["source"]
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        site_sync = pool.submit(
+            copy_static_site, str(site_dir), str(docs_dir), manifest, force=args.force, link=args.link
+        )
 
-    json_path = data_dir / "stats.v1.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+        # Export JSON data
+        db_path = Path(args.db).resolve()
+        source = _source_signature(db_path, args.pretty)
+        outputs = ("data/stats.v1.json", "data/stats.v1.json.gz")
+        # Same database file, aggregation code and layout: reuse the outputs
+        if not (manifest.get("source") == source and all((docs_dir / rel).exists() for rel in outputs)):
+            _export_stats(db_path, docs_dir, manifest, args.pretty)
+            manifest["source"] = source
+
+        site_sync.result()
 
     # Export JSON schema alongside the data for a visible contract
     schema_src = repo_root / "backend" / "stats.v1.schema.json"
     if schema_src.exists():
-        (data_dir / "stats.v1.schema.json").write_text(schema_src.read_text(encoding="utf-8"), encoding="utf-8")
+        digest = hashlib.sha256(schema_src.read_bytes()).hexdigest()
+        if not is_up_to_date(str(docs_dir), "data/stats.v1.schema.json", digest, manifest):
+            shutil.copyfile(schema_src, data_dir / "stats.v1.schema.json")
+            record_output(manifest, "data/stats.v1.schema.json", digest)
+
+    save_manifest(str(docs_dir), manifest)
 
     return 0
 
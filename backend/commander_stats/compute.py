@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Dict, List, Tuple
 import datetime
 import sqlite3
@@ -59,45 +61,30 @@ def compute_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
         ORDER BY g.id ASC
         """
     )
-    rows_entries = _rows_to_dicts(cur.fetchall())
-
-    # game_id -> {winner:str, entries:[{player, commander, bracket}]}
-    games: Dict[int, Dict[str, Any]] = {}
-    for r in rows_entries:
-        gid = int(r["game_id"])
-        g = games.get(gid)
-        if g is None:
-            g = {"winner": r.get("winner_player"), "entries": []}
-            games[gid] = g
-        g["entries"].append(
-            {
-                "player": r.get("player"),
-                "commander": r.get("commander"),
-                "bracket": r.get("bracket"),
-            }
-        )
 
     # Aggregation maps
     by_player_w: Dict[str, Dict[str, Any]] = {}
     by_pair_w: Dict[Tuple[str, str, Any], Dict[str, Any]] = {}
 
-    for g in games.values():
-        winner = g.get("winner")
-        entries = g.get("entries") or []
+    # Rows arrive ordered by game id: group consecutive rows per game straight
+    # off the cursor, so only one game's entries are held in memory at a time
+    for _, group in groupby(cur, key=itemgetter("game_id")):
+        entries = list(group)
+        winner = entries[0]["winner_player"]
 
         # Winner bracket
         bw = None
         for e in entries:
-            if e.get("player") == winner:
-                bw = _to_float_bracket(e.get("bracket"))
+            if e["player"] == winner:
+                bw = _to_float_bracket(e["bracket"])
                 break
 
         # Average bracket excluding winner (only numeric brackets)
         others: List[float] = []
         for e in entries:
-            if e.get("player") == winner:
+            if e["player"] == winner:
                 continue
-            bb = _to_float_bracket(e.get("bracket"))
+            bb = _to_float_bracket(e["bracket"])
             if bb is not None:
                 others.append(bb)
 
@@ -109,9 +96,9 @@ def compute_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
             w = _weight(delta)
 
         for e in entries:
-            p = e.get("player") or ""
-            c = e.get("commander") or ""
-            b = e.get("bracket")
+            p = e["player"] or ""
+            c = e["commander"] or ""
+            b = e["bracket"]
 
             # By player
             curp = by_player_w.get(p)
@@ -156,20 +143,8 @@ def compute_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
         )
     )
 
-    # By player
-    cur.execute("""
-        SELECT
-            ge.player AS player,
-            COUNT(*) AS games,
-            SUM(CASE WHEN g.winner_player = ge.player THEN 1 ELSE 0 END) AS wins
-        FROM gameentry ge
-        JOIN game g ON g.id = ge.game_id
-        GROUP BY ge.player
-        ORDER BY games DESC, wins DESC, player ASC
-    """)
-    by_player = _rows_to_dicts(cur.fetchall())
-
-    # By player + commander (+ bracket)
+    # By player + commander (+ bracket): the only grouped pass over the join.
+    # by_player and the filter lists are derived from it below.
     cur.execute("""
         SELECT
             ge.player AS player,
@@ -184,22 +159,37 @@ def compute_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
     """)
     by_player_commander = _rows_to_dicts(cur.fetchall())
 
-    # Distinct filter values
-    cur.execute("SELECT DISTINCT player FROM gameentry ORDER BY player ASC;")
-    players = [r["player"] for r in cur.fetchall()]
-
-    cur.execute("SELECT DISTINCT commander FROM gameentry ORDER BY commander ASC;")
-    commanders = [r["commander"] for r in cur.fetchall()]
-
-    cur.execute("SELECT DISTINCT bracket FROM gameentry WHERE bracket IS NOT NULL ORDER BY bracket ASC;")
-    brackets = [r["bracket"] for r in cur.fetchall()]
-
-    # High-level counts
-    cur.execute("SELECT COUNT(*) AS n FROM game;")
-    n_games = int(cur.fetchone()["n"])
-
-    cur.execute("SELECT COUNT(*) AS n FROM gameentry;")
-    n_entries = int(cur.fetchone()["n"])
+    # By player
+    by_player_map: Dict[str, Dict[str, Any]] = {}
+    commanders_set = set()
+    brackets_set = set()
+    for r in by_player_commander:
+        curp = by_player_map.get(r["player"])
+        if curp is None:
+            curp = {"player": r["player"], "games": 0, "wins": 0}
+            by_player_map[r["player"]] = curp
+        curp["games"] += r["games"]
+        curp["wins"] += r["wins"]
+        commanders_set.add(r["commander"])
+        if r["bracket"] is not None:
+            brackets_set.add(r["bracket"])
+
+    by_player = sorted(by_player_map.values(), key=lambda r: (-r["games"], -r["wins"], r["player"]))
+
+    # Distinct filter values (numbers sort before text, as in SQLite)
+    players = sorted(by_player_map)
+    commanders = sorted(commanders_set)
+    brackets = sorted(brackets_set, key=lambda b: (isinstance(b, str), b))
+
+    # High-level counts (single round-trip)
+    cur.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM game) AS games,
+            (SELECT COUNT(*) FROM gameentry) AS entries
+    """)
+    row = cur.fetchone()
+    n_games = int(row["games"])
+    n_entries = int(row["entries"])
 
     generated_utc = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
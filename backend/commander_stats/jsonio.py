@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+try:  # Optional C encoder; the stdlib json module is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _layout(indent: bool) -> Dict[str, Any]:
+    # Stdlib options matching orjson's output: 2-space indent or fully compact.
+    return {"indent": 2} if indent else {"separators": (",", ":")}
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes.
+
+    Uses orjson when installed, otherwise json.dumps(ensure_ascii=False).
+    Output is compact unless indent=True (2 spaces).
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, **_layout(indent)).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,13 +1,110 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
 
+from . import jsonio
 
-def copy_static_site(frontend_site_dir: str, docs_dir: str) -> None:
-    """Copy the frontend/site folder into docs_dir (static site root).
+MANIFEST_NAME = ".manifest.json"
 
-    This function replaces the destination directory to avoid partial/stale copies.
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _walk_files(root: str, prefix: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+    """Yield (relative posix path, DirEntry) for every file under root.
+
+    os.scandir() returns the file type with each entry, so directories and
+    files are told apart without an extra stat() per path.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        rel = prefix + entry.name
+        if entry.is_dir():
+            yield from _walk_files(entry.path, rel + "/")
+        elif entry.is_file():
+            yield rel, entry
+
+
+def _copy(src: Path, dst: Path) -> None:
+    # Unlink first: the target may be a hard link to src left by --link,
+    # and copying over it would write through to the source itself.
+    dst.unlink(missing_ok=True)
+    shutil.copy2(src, dst)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    # Hard link when possible (no bytes copied); fall back to a real copy
+    # across filesystems or where links are not supported.
+    try:
+        dst.unlink(missing_ok=True)
+        os.link(src, dst)
+    except OSError:
+        _copy(src, dst)
+
+
+def load_manifest(docs_dir: str) -> Dict[str, Any]:
+    """Load the export manifest from docs_dir (empty dict if missing/corrupt)."""
+    path = Path(docs_dir) / MANIFEST_NAME
+    try:
+        manifest = jsonio.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(docs_dir: str, manifest: Dict[str, Any]) -> None:
+    """Write the export manifest into docs_dir."""
+    path = Path(docs_dir) / MANIFEST_NAME
+    path.write_bytes(jsonio.dumps(manifest, indent=True, sort_keys=True))
+
+
+def is_up_to_date(docs_dir: str, rel: str, digest: str, manifest: Dict[str, Any]) -> bool:
+    """Return True if docs_dir/rel exists and was last written with this digest.
+
+    Generated outputs are tracked under manifest["data"]; see record_output().
+    """
+    data = manifest.get("data") or {}
+    return data.get(rel) == digest and (Path(docs_dir) / rel).exists()
+
+
+def record_output(manifest: Dict[str, Any], rel: str, digest: str) -> None:
+    """Record in the manifest that docs_dir/rel was written with this digest.
+
+    Call it only after the file has been written successfully.
+    """
+    manifest.setdefault("data", {})[rel] = digest
+
+
+def copy_static_site(
+    frontend_site_dir: str,
+    docs_dir: str,
+    manifest: Dict[str, Any] | None = None,
+    force: bool = False,
+    link: bool = False,
+) -> None:
+    """Sync the frontend/site folder into docs_dir (static site root).
+
+    Incremental: the manifest in docs_dir maps each copied file (relative path)
+    to the size, mtime and sha256 of its source, and only files whose hash
+    changed (or that are missing in docs_dir) are copied again. Sources whose
+    size and mtime match the manifest are not even re-hashed. Files copied by
+    a previous export but no longer present in the source are removed.
+    Anything the manifest does not track (e.g. the generated data/ folder) is
+    left untouched.
+
+    When a manifest dict is passed in it is updated in place and saving it is
+    left to the caller; otherwise it is loaded from and saved to docs_dir.
+    With force=True every source is re-hashed and copied regardless of the
+    manifest (stale files are still removed). With link=True files are hard
+    linked instead of copied where the filesystem allows it; the docs copy
+    then shares its contents with frontend/site.
     """
     src = Path(frontend_site_dir).resolve()
     dst = Path(docs_dir).resolve()
@@ -15,8 +112,46 @@ def copy_static_site(frontend_site_dir: str, docs_dir: str) -> None:
     if not src.exists():
         raise FileNotFoundError(f"Frontend site directory not found: {src}")
 
-    # Replace destination atomically-ish: remove then copy.
-    if dst.exists():
-        shutil.rmtree(dst)
+    dst.mkdir(parents=True, exist_ok=True)
+    own_manifest = manifest is None
+    if manifest is None:
+        manifest = load_manifest(str(dst))
+    old_files: Dict[str, Any] = manifest.get("files") or {}
+    new_files: Dict[str, Any] = {}
+    to_copy: List[Tuple[Path, Path]] = []
+
+    for rel, entry in _walk_files(str(src)):
+        path = Path(entry.path)
+        st = entry.stat()
+        old = old_files.get(rel)
+        if not isinstance(old, dict):
+            old = {}
+
+        if not force and old.get("size") == st.st_size and old.get("mtime_ns") == st.st_mtime_ns:
+            digest = old.get("sha256")
+        else:
+            digest = _sha256(path)
+        new_files[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+
+        target = dst / rel
+        if not force and old.get("sha256") == digest and target.exists():
+            continue
+        to_copy.append((path, target))
+
+    # Create each destination directory once, not once per file
+    for d in sorted({target.parent for _, target in to_copy}):
+        d.mkdir(parents=True, exist_ok=True)
+
+    # Copies are independent: overlap their open/write/close syscalls
+    if to_copy:
+        with ThreadPoolExecutor(max_workers=min(8, len(to_copy))) as pool:
+            copy = _link_or_copy if link else _copy
+            list(pool.map(lambda pt: copy(*pt), to_copy))
+
+    # Drop files left behind by a previous export
+    for rel in old_files.keys() - new_files.keys():
+        (dst / rel).unlink(missing_ok=True)
 
-    shutil.copytree(src, dst, dirs_exist_ok=True)
+    manifest["files"] = new_files
+    if own_manifest:
+        save_manifest(str(dst), manifest)
@@ -14,6 +14,16 @@ let winrateBubbleChart = null;
 // Default for Top N commander filter when a single player is selected
 const DEFAULT_TOP_N = 3;
 
+// Player + Commander table: rows rendered per page ("Mostra altri" adds one more)
+const PAIR_PAGE = 400;
+let pairRows = [];
+let pairShown = PAIR_PAGE;
+
+// One shared collator: faster than String#localeCompare, which sets up the
+// locale comparison again on every call
+const collator = new Intl.Collator("it");
+const cmpText = (a, b) => collator.compare(String(a || ""), String(b || ""));
+
 // Page mode (normal vs weighted). Weighted pages set window.STATS_MODE = "weighted".
 const STATS_MODE = (typeof window !== "undefined" && window.STATS_MODE) ? window.STATS_MODE : "normal";
 
@@ -22,15 +32,40 @@ function isWeightedMode() {
 }
 
 function viewData(raw) {
-  // Provide a uniform view for the rest of the UI.
-  if (!isWeightedMode()) return raw;
+  // Provide a uniform view for the rest of the UI. Missing collections are
+  // normalized once here, so the render paths can use them without fallbacks.
+  const weighted = isWeightedMode();
+  const filters = raw.filters || {};
+  const byPlayerCommander = (weighted && raw.by_player_commander_weighted) || raw.by_player_commander || [];
+  // player -> its (player, commander, bracket) rows, so a player filter does
+  // not have to scan every row on each render
+  const pairsByPlayer = new Map();
+  for (const r of byPlayerCommander) {
+    const list = pairsByPlayer.get(r.player);
+    if (list) list.push(r);
+    else pairsByPlayer.set(r.player, [r]);
+  }
   return {
     ...raw,
-    by_player: raw.by_player_weighted || raw.by_player || [],
-    by_player_commander: raw.by_player_commander_weighted || raw.by_player_commander || [],
+    counts: raw.counts || {},
+    filters: {
+      players: filters.players || [],
+      // Sorted once here for the "all commanders" dropdown
+      commanders: (filters.commanders || []).slice().sort(cmpText),
+      brackets: filters.brackets || [],
+    },
+    by_player: (weighted && raw.by_player_weighted) || raw.by_player || [],
+    by_player_commander: byPlayerCommander,
+    pairsByPlayer,
   };
 }
 
+function pairsForPlayer(data, player) {
+  // All (player, commander, bracket) rows when no player is selected
+  if (!player) return data.by_player_commander;
+  return data.pairsByPlayer.get(player) || [];
+}
+
 
 function makeDarkScales({
   xTitle,
@@ -107,18 +142,16 @@ function clampTopN(v) {
   return DEFAULT_TOP_N;
 }
 
-function makeRateFragment(winsRaw, gamesRaw, winsWeighted, gamesWeighted) {
-  const span = document.createElement("span");
+function rateHtml(winsRaw, gamesRaw, winsWeighted, gamesWeighted) {
   const gw = (gamesWeighted === undefined || gamesWeighted === null) ? gamesRaw : gamesWeighted;
   const ww = (winsWeighted === undefined || winsWeighted === null) ? winsRaw : winsWeighted;
   const rate = gw ? ww / gw : 0;
   // Show raw integers (human-meaningful) and compute % from weighted if available.
-  span.innerHTML = `${fmtCount(winsRaw)} / ${fmtCount(gamesRaw)} <span class="badge">${fmtPct(rate)}</span>`;
-  return span;
+  return `<span>${fmtCount(winsRaw)} / ${fmtCount(gamesRaw)} <span class="badge">${fmtPct(rate)}</span></span>`;
 }
 
 function buildPlayerColorMap(players) {
-  const arr = (players || []).slice().sort((a, b) => String(a || "").localeCompare(String(b || "")));
+  const arr = (players || []).slice().sort(cmpText);
   const map = new Map();
   const n = Math.max(arr.length, 1);
   arr.forEach((p, i) => {
@@ -150,12 +183,11 @@ function computePlayerRowsForCharts(data, state) {
   // If commander is selected, base charts on (player,commander,bracket) rows filtered by commander.
   // Otherwise, use pre-aggregated by_player.
   if (state.commander) {
-    const rowsPairFiltered = (data.by_player_commander || [])
-      .filter((r) => !state.player || r.player === state.player)
+    const rowsPairFiltered = pairsForPlayer(data, state.player)
       .filter((r) => r.commander === state.commander);
     return aggregatePlayersFromPairs(rowsPairFiltered);
   }
-  return (data.by_player || []).filter((r) => !state.player || r.player === state.player);
+  return data.by_player.filter((r) => !state.player || r.player === state.player);
 }
 
 function renderCharts(rowsPlayer, allPlayers, state) {
@@ -182,7 +214,7 @@ function renderCharts(rowsPlayer, allPlayers, state) {
     const aw = Number(a.wins || 0), bw = Number(b.wins || 0);
     const ar = ag ? aw / ag : 0;
     const br = bg ? bw / bg : 0;
-    return (ar - br) || (bg - ag) || String(a.player || "").localeCompare(String(b.player || ""));
+    return (ar - br) || (bg - ag) || cmpText(a.player, b.player);
   });
   const byPlayer = new Map(rows.map((r) => [r.player, r]));
 
@@ -296,12 +328,10 @@ function setOptions(selectEl, values, keepValue = "") {
   // keep first option ("Tutti")
   while (el.options.length > 1) el.remove(1);
 
-  (values || []).forEach((v) => {
-    const opt = document.createElement("option");
-    opt.value = v;
-    opt.textContent = v;
-    el.appendChild(opt);
-  });
+  // Build all options off-DOM and attach them in one go
+  const frag = document.createDocumentFragment();
+  for (const v of values || []) frag.appendChild(new Option(v, v));
+  el.appendChild(frag);
 
   // restore if possible
   if ([...el.options].some((o) => o.value === prev)) el.value = prev;
@@ -399,7 +429,7 @@ function renderCommanderChart(data, state) {
   }
 
   // Build commander rows
-  let rows = aggregateCommandersForPlayer(data.by_player_commander || [], player);
+  let rows = aggregateCommandersForPlayer(pairsForPlayer(data, player), player);
   if (state.commander) rows = rows.filter((r) => r.commander === state.commander);
 
   const rowsSorted = rows
@@ -409,7 +439,7 @@ function renderCommanderChart(data, state) {
       const wr = g ? w / g : 0;
       return { ...r, wr, wrPct: Math.round(wr * 1000) / 10 };
     })
-    .sort((a, b) => (b.wr - a.wr) || (Number(b.games || 0) - Number(a.games || 0)) || String(a.commander || "").localeCompare(String(b.commander || "")))
+    .sort((a, b) => (b.wr - a.wr) || (Number(b.games || 0) - Number(a.games || 0)) || cmpText(a.commander, b.commander))
     .slice(0, Math.max(1, topN));
 
   const labels = rowsSorted.map((r) => r.commander || "(n/a)");
@@ -451,15 +481,11 @@ function renderCommanderChart(data, state) {
 
 function commandersForPlayer(data, player) {
   if (!player) {
-    return (data.filters?.commanders || [])
-      .slice()
-      .sort((a, b) => String(a || "").localeCompare(String(b || "")));
+    return data.filters.commanders;
   }
   const set = new Set();
-  for (const r of data.by_player_commander || []) {
-    if (r.player === player) set.add(r.commander);
-  }
-  return Array.from(set).sort((a, b) => a.localeCompare(b));
+  for (const r of pairsForPlayer(data, player)) set.add(r.commander);
+  return Array.from(set).sort(cmpText);
 }
 
 function aggregateBracketsFromPairs(rowsPair) {
@@ -473,7 +499,7 @@ function aggregateBracketsFromPairs(rowsPair) {
     cur.games_w += rowGamesW(r);
     map.set(key, cur);
   }
-  return Array.from(map.values()).sort((a, b) => b.games - a.games || a.bracket.localeCompare(b.bracket));
+  return Array.from(map.values()).sort((a, b) => b.games - a.games || cmpText(a.bracket, b.bracket));
 }
 
 function sortRows(rows, mode, kind) {
@@ -485,17 +511,16 @@ function sortRows(rows, mode, kind) {
     return g ? w / g : 0;
   };
 
-  const cmpStr = (a, b) => String(a || "").localeCompare(String(b || ""));
   const alpha = (a, b) => {
     if (kind === "pair") {
       return (
-        cmpStr(a.player, b.player) ||
-        cmpStr(a.commander, b.commander) ||
-        cmpStr(a.bracket, b.bracket)
+        cmpText(a.player, b.player) ||
+        cmpText(a.commander, b.commander) ||
+        cmpText(a.bracket, b.bracket)
       );
     }
-    if (kind === "bracket") return cmpStr(a.bracket, b.bracket);
-    return cmpStr(a.player, b.player);
+    if (kind === "bracket") return cmpText(a.bracket, b.bracket);
+    return cmpText(a.player, b.player);
   };
 
   switch (mode) {
@@ -516,71 +541,68 @@ function sortRows(rows, mode, kind) {
   return arr;
 }
 
+const HTML_ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" };
+
+function escapeHtml(v) {
+  return String(v).replace(/[&<>"']/g, (ch) => HTML_ESCAPES[ch]);
+}
+
 function td(text, className, label) {
-  const cell = document.createElement("td");
-  if (className) cell.className = className;
-  if (label) cell.dataset.label = label;
-  cell.textContent = text;
-  return cell;
+  const cls = className ? ` class="${className}"` : "";
+  return `<td${cls} data-label="${label}">${escapeHtml(text)}</td>`;
 }
 
-function renderPlayer(rows) {
-  const tb = $("#tPlayer tbody");
-  tb.innerHTML = "";
+function rateTd(r) {
+  return `<td class="num" data-label="Win rate">${rateHtml(rowWinsRaw(r), rowGamesRaw(r), rowWinsW(r), rowGamesW(r))}</td>`;
+}
 
+// Tables are built as one HTML string and parsed once per render, instead of
+// creating every cell through the DOM API.
+function renderPlayer(rows) {
+  let html = "";
   for (const r of rows) {
-    const tr = document.createElement("tr");
-    tr.appendChild(td(r.player ?? "", "", "Player"));
-    tr.appendChild(td(fmtCount(r.wins ?? 0), "num", "Vittorie"));
-    tr.appendChild(td(fmtCount(r.games ?? 0), "num", "Partite"));
-    const rateCell = document.createElement("td");
-    rateCell.className = "num";
-    rateCell.dataset.label = "Win rate";
-    rateCell.appendChild(makeRateFragment(rowWinsRaw(r), rowGamesRaw(r), rowWinsW(r), rowGamesW(r)));
-    tr.appendChild(rateCell);
-    tb.appendChild(tr);
+    html += "<tr>"
+      + td(r.player ?? "", "", "Player")
+      + td(fmtCount(r.wins ?? 0), "num", "Vittorie")
+      + td(fmtCount(r.games ?? 0), "num", "Partite")
+      + rateTd(r)
+      + "</tr>";
   }
+  $("#tPlayer tbody").innerHTML = html;
   $("#countPlayer").textContent = `${rows.length} righe`;
 }
 
 function renderPair(rows) {
-  const tb = $("#tPair tbody");
-  tb.innerHTML = "";
-  const cap = 400;
-
+  pairRows = rows;
+  const cap = pairShown;
+  let html = "";
   for (const r of rows.slice(0, cap)) {
-    const tr = document.createElement("tr");
-    tr.appendChild(td(r.player ?? "", "", "Player"));
-    tr.appendChild(td(r.commander ?? "", "", "Commander"));
-    tr.appendChild(td(r.bracket === null || r.bracket === undefined ? "n/a" : String(r.bracket), "", "Bracket"));
-    tr.appendChild(td(fmtCount(r.wins ?? 0), "num", "Vittorie"));
-    tr.appendChild(td(fmtCount(r.games ?? 0), "num", "Partite"));
-    const rateCell = document.createElement("td");
-    rateCell.className = "num";
-    rateCell.dataset.label = "Win rate";
-    rateCell.appendChild(makeRateFragment(rowWinsRaw(r), rowGamesRaw(r), rowWinsW(r), rowGamesW(r)));
-    tr.appendChild(rateCell);
-    tb.appendChild(tr);
+    html += "<tr>"
+      + td(r.player ?? "", "", "Player")
+      + td(r.commander ?? "", "", "Commander")
+      + td(r.bracket === null || r.bracket === undefined ? "n/a" : String(r.bracket), "", "Bracket")
+      + td(fmtCount(r.wins ?? 0), "num", "Vittorie")
+      + td(fmtCount(r.games ?? 0), "num", "Partite")
+      + rateTd(r)
+      + "</tr>";
   }
+  $("#tPair tbody").innerHTML = html;
 
   $("#countPair").textContent = rows.length > cap ? `${cap}/${rows.length} righe` : `${rows.length} righe`;
+  $("#morePair")?.classList.toggle("is-hidden", rows.length <= cap);
 }
 
 function renderBracket(rows) {
-  const tb = $("#tBracket tbody");
-  tb.innerHTML = "";
+  let html = "";
   for (const r of rows) {
-    const tr = document.createElement("tr");
-    tr.appendChild(td(r.bracket ?? "n/a", "", "Bracket"));
-    tr.appendChild(td(fmtCount(r.wins ?? 0), "num", "Vittorie"));
-    tr.appendChild(td(fmtCount(r.games ?? 0), "num", "Partite"));
-    const rateCell = document.createElement("td");
-    rateCell.className = "num";
-    rateCell.dataset.label = "Win rate";
-    rateCell.appendChild(makeRateFragment(rowWinsRaw(r), rowGamesRaw(r), rowWinsW(r), rowGamesW(r)));
-    tr.appendChild(rateCell);
-    tb.appendChild(tr);
+    html += "<tr>"
+      + td(r.bracket ?? "n/a", "", "Bracket")
+      + td(fmtCount(r.wins ?? 0), "num", "Vittorie")
+      + td(fmtCount(r.games ?? 0), "num", "Partite")
+      + rateTd(r)
+      + "</tr>";
   }
+  $("#tBracket tbody").innerHTML = html;
   $("#countBracket").textContent = `${rows.length} righe`;
 }
 
@@ -588,6 +610,23 @@ function updateCommanderOptions(data, player, keepCommanderValue = "") {
   setOptions($("#fCommander"), commandersForPlayer(data, player), keepCommanderValue);
 }
 
+// Filtered rows of each table: a sort change only re-sorts and re-renders
+// its own table, without touching filters, charts or the other tables
+const tableRows = { player: [], pair: [], bracket: [] };
+
+function renderPlayerTable() {
+  renderPlayer(sortRows(tableRows.player, $("#sPlayer")?.value || "alpha", "player"));
+}
+
+function renderPairTable() {
+  pairShown = PAIR_PAGE;
+  renderPair(sortRows(tableRows.pair, $("#sPair")?.value || "alpha", "pair"));
+}
+
+function renderBracketTable() {
+  renderBracket(sortRows(tableRows.bracket, $("#sBracket")?.value || "games_desc", "bracket"));
+}
+
 function buildTables(data) {
   const state = {
     player: $("#fPlayer").value,
@@ -613,50 +652,55 @@ function buildTables(data) {
     if (title) title.textContent = "Winrate per player";
     renderCharts(
       computePlayerRowsForCharts(data, state),
-      data.filters?.players || [],
+      data.filters.players,
       state
     );
   }
 
-  const rowsP = sortRows(
-    (data.by_player || []).filter((r) => !state.player || r.player === state.player),
-    $("#sPlayer")?.value || "alpha",
-    "player"
-  );
-  renderPlayer(rowsP);
-
-  const rowsPair = sortRows(
-    (data.by_player_commander || [])
-      .filter((r) => !state.player || r.player === state.player)
-      .filter((r) => !state.commander || r.commander === state.commander),
-    $("#sPair")?.value || "alpha",
-    "pair"
-  );
-  renderPair(rowsPair);
-
-  const rowsBracket = sortRows(
-    aggregateBracketsFromPairs(rowsPair),
-    $("#sBracket")?.value || "games_desc",
-    "bracket"
-  );
-  renderBracket(rowsBracket);
+  tableRows.player = data.by_player.filter((r) => !state.player || r.player === state.player);
+  tableRows.pair = pairsForPlayer(data, state.player)
+    .filter((r) => !state.commander || r.commander === state.commander);
+  tableRows.bracket = aggregateBracketsFromPairs(tableRows.pair);
+  renderPlayerTable();
+  renderPairTable();
+  renderBracketTable();
 }
 
-async function main() {
-  const res = await fetch("../data/stats.v1.json", { cache: "no-store" });
+async function loadStats() {
+  // Prefer the pre-compressed copy when the browser can inflate it.
+  // Any failure (old browser, missing file, server already decoding it)
+  // falls back to the plain JSON.
+  // "no-cache" revalidates with the server (ETag/Last-Modified) instead of
+  // re-downloading: an unchanged dataset costs a 304, a new deploy is seen
+  // right away.
+  if (typeof DecompressionStream === "function") {
+    try {
+      const res = await fetch("../data/stats.v1.json.gz", { cache: "no-cache" });
+      if (res.ok && res.body) {
+        return await new Response(res.body.pipeThrough(new DecompressionStream("gzip"))).json();
+      }
+    } catch (err) {
+      console.warn("stats.v1.json.gz non disponibile, uso stats.v1.json", err);
+    }
+  }
+  const res = await fetch("../data/stats.v1.json", { cache: "no-cache" });
   if (!res.ok) throw new Error(`HTTP ${res.status} (${res.statusText})`);
-  const raw = await res.json();
+  return res.json();
+}
+
+async function main() {
+  const raw = await loadStats();
   const data = viewData(raw);
 
-  const games = data.counts?.games ?? 0;
-  const entries = data.counts?.entries ?? 0;
+  const games = data.counts.games ?? 0;
+  const entries = data.counts.entries ?? 0;
   const gen = data.generated_utc ?? "";
   const wMeta = isWeightedMode() && raw.weighted
     ? ` · w: k=${raw.weighted.k}, min=${raw.weighted.w_min}, max=${raw.weighted.w_max}`
     : "";
   $("#meta").textContent = `${games} game · ${entries} entries${gen ? " · gen " + gen : ""}${wMeta}`;
 
-  setOptions($("#fPlayer"), data.filters?.players || []);
+  setOptions($("#fPlayer"), data.filters.players);
 
   // Load state from querystring
   const qs = qsGet();
@@ -676,9 +720,15 @@ async function main() {
   $("#fTopN")?.addEventListener("change", rerender);
 
   // Sorting dropdowns
-  $("#sPlayer")?.addEventListener("change", rerender);
-  $("#sPair")?.addEventListener("change", rerender);
-  $("#sBracket")?.addEventListener("change", rerender);
+  $("#sPlayer")?.addEventListener("change", renderPlayerTable);
+  $("#sPair")?.addEventListener("change", renderPairTable);
+  $("#sBracket")?.addEventListener("change", renderBracketTable);
+
+  // Next page of the pair table only: filters and the other tables are unchanged
+  $("#btnMorePair")?.addEventListener("click", () => {
+    pairShown += PAIR_PAGE;
+    renderPair(pairRows);
+  });
 
   $("#btnReset").addEventListener("click", () => {
     $("#fPlayer").value = "";